@@ -1,6 +1,6 @@
 import sys
-import time
-from multiprocessing import Event, Manager, Process, Value
+import threading
+from itertools import cycle
 
 _spinner_frames = [
     "▁",
@@ -28,62 +28,73 @@ _spinner_frames = [
     "▂",
 ]
 
+_clear_line = "\r\033[2K"
+
 
 class ProgressReporter:
     def __init__(self, title: str):
         self.title = title
-        self.progress = Value("d", -1)
-        self.done_text = Manager().dict()
-        self.process = Process(target=self._run)
-        self.done_event = Event()
-        self.spinner_frame_index = 0
-        self.last_output_length = 0
+        self.progress: float = -1
+        self.done_text = "Done!"
+        self.failed = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.done_event = threading.Event()
 
     def start(self):
-        self.process.start()
+        self.is_terminal = sys.stdout.isatty()
+        if not self.is_terminal:
+            self._draw(f"{self.title} ...\n")
+        self.thread.start()
 
     def update(self, value: float):
-        with self.progress.get_lock():
-            self.progress.value = max(min(value, 1), 0)
+        self.progress = max(min(value, 1), 0)
 
     def finish(self, done_text: str = "Done!"):
-        self.done_text["done"] = done_text
+        self.done_text = done_text
         self.done_event.set()
-        self.process.join()
+        self.thread.join()
 
     def __enter__(self):
         self.start()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        self.failed = exc_type is not None
         self.finish()
 
     def _run(self):
-        try:
-            while not self.done_event.is_set():
-                with self.progress.get_lock():
-                    current_progress = self.progress.value
-                self.spinner_frame_index = (self.spinner_frame_index + 1) % len(
-                    _spinner_frames
-                )
-                progress_text = (
-                    f"{current_progress * 100:.2f}%" if current_progress >= 0 else "..."
-                )
-                self._draw(progress_text)
-                time.sleep(0.1)
-            self._draw(self.done_text.get("done", "Done!"), "✅")
-        except KeyboardInterrupt:
-            pass
-        finally:
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+        title = f" {self.title} "
+        # Only animate on a terminal.
+        if self.is_terminal:
+            spinner = cycle(
+                [f"{_clear_line}{frame}{title}" for frame in _spinner_frames]
+            )
+            last_progress = None
+            while True:
+                current_progress = self.progress
+                # Only reformat the percentage when it changes.
+                if current_progress != last_progress:
+                    last_progress = current_progress
+                    progress_text = (
+                        f"{current_progress * 100:.2f}%"
+                        if current_progress >= 0
+                        else "..."
+                    )
+                self._draw(next(spinner) + progress_text)
+                if self.done_event.wait(0.1):
+                    break
+        else:
+            self.done_event.wait()
+
+        # Don't report an interrupted or failed block as done.
+        if self.failed:
+            if self.is_terminal:
+                self._draw("\n")
+            return
+
+        done_line = f"✅{title}{self.done_text}\n"
+        self._draw(_clear_line + done_line if self.is_terminal else done_line)
 
-    def _draw(self, text: str, override_spinner_frame: str = None):
-        output = (
-            f"{override_spinner_frame or _spinner_frames[self.spinner_frame_index]} "
-            f"{self.title} {text}"
-        )
-        output_with_spaces = output.ljust(self.last_output_length)
-        sys.stdout.write("\r" + output_with_spaces)
+    def _draw(self, line: str):
+        sys.stdout.write(line)
         sys.stdout.flush()
-        self.last_output_length = len(output)
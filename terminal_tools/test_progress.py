@@ -0,0 +1,90 @@
+import io
+
+import pytest
+
+from .progress import ProgressReporter
+
+
+class _FakeTerminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestProgressReporter:
+    def test_update_clamps_progress(self):
+        """Test that update keeps the progress within [0, 1]."""
+        reporter = ProgressReporter("Clamping")
+        reporter.update(1.5)
+        assert reporter.progress == 1
+        reporter.update(-0.5)
+        assert reporter.progress == 0
+        reporter.update(0.25)
+        assert reporter.progress == 0.25
+
+    def test_non_terminal_output_is_start_and_done_lines(self, capsys):
+        """Test that off a terminal only a start and a done line are printed."""
+        with ProgressReporter("Counting") as progress:
+            assert capsys.readouterr().out == "Counting ...\n"
+            progress.update(0.5)
+
+        assert capsys.readouterr().out == "✅ Counting Done!\n"
+
+    def test_finish_with_custom_done_text(self, capsys):
+        """Test that the text passed to finish replaces the default."""
+        progress = ProgressReporter("Exporting")
+        progress.start()
+        progress.finish("Saved 3 files")
+
+        assert capsys.readouterr().out == (
+            "Exporting ...\n✅ Exporting Saved 3 files\n"
+        )
+        assert not progress.thread.is_alive()
+
+    def test_terminal_output_repaints_line(self, monkeypatch):
+        """Test that frames on a terminal clear and repaint the same line."""
+        terminal = _FakeTerminal()
+        monkeypatch.setattr("sys.stdout", terminal)
+
+        progress = ProgressReporter("Loading")
+        progress.update(0.5)
+        progress.start()
+        progress.finish()
+
+        frames = terminal.getvalue().removesuffix("\n").split("\r\033[2K")
+        assert len(frames) > 2
+        assert frames[0] == ""
+        assert frames[1].endswith(" Loading 50.00%")
+        assert frames[-1] == "✅ Loading Done!"
+
+    def test_terminal_output_before_first_update(self, monkeypatch):
+        """Test that progress shows as "..." until the first update."""
+        terminal = _FakeTerminal()
+        monkeypatch.setattr("sys.stdout", terminal)
+
+        progress = ProgressReporter("Waiting")
+        progress.start()
+        progress.finish()
+
+        frames = terminal.getvalue().removesuffix("\n").split("\r\033[2K")
+        assert frames[1].endswith(" Waiting ...")
+
+    def test_interrupted_block_is_not_reported_done(self, monkeypatch):
+        """Test that Ctrl+C inside the block ends the line without success."""
+        terminal = _FakeTerminal()
+        monkeypatch.setattr("sys.stdout", terminal)
+
+        with pytest.raises(KeyboardInterrupt):
+            with ProgressReporter("Exporting") as progress:
+                raise KeyboardInterrupt
+
+        assert "✅" not in terminal.getvalue()
+        assert terminal.getvalue().endswith("\n")
+        assert not progress.thread.is_alive()
+
+    def test_failed_block_off_terminal_prints_start_line_only(self, capsys):
+        """Test that an exception off a terminal leaves only the start line."""
+        with pytest.raises(RuntimeError):
+            with ProgressReporter("Counting"):
+                raise RuntimeError("boom")
+
+        assert capsys.readouterr().out == "Counting ...\n"